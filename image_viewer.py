@@ -16,12 +16,16 @@ from PyQt5.QtWidgets import (
     QCheckBox,
     QDesktopWidget,
     QInputDialog,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
 )
 from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor
-from PyQt5.QtCore import Qt, QPoint, QTimer
+from PyQt5.QtCore import Qt, QPoint, QTimer, QEvent
 from PIL import Image, ImageFile
 from pillow_heif import register_heif_opener
 from collections import OrderedDict
+from bisect import bisect_left, bisect_right
 
 register_heif_opener()
 import subprocess
@@ -34,6 +38,91 @@ class ResizableLabel(QLabel):
         self.setAlignment(Qt.AlignCenter)
 
 
+class FilenameSearchIndex:
+    """self.images と同じ並びでファイル名(小文字)を保持する検索インデックス"""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.names = []
+        self.offsets = []  # 連結文字列内での各ファイル名の開始位置
+        self.length = 0
+        self._blob = None
+        self._sorted_indices = None
+        self._sorted_names = None
+
+    def add(self, path):
+        # ディレクトリ走査中に呼ばれるため、ここでは追記のみ行う
+        name = os.path.basename(path).lower()
+        self.names.append(name)
+        self.offsets.append(self.length)
+        self.length += len(name) + 1
+        self._blob = None
+        self._sorted_indices = None
+        self._sorted_names = None
+
+    def remove(self, index):
+        # 構築済みの検索用データは作り直さず、該当エントリだけを取り除く
+        name = self.names.pop(index)
+        offset = self.offsets[index]
+        shift = len(name) + 1
+        del self.offsets[index]
+        self.offsets[index:] = [o - shift for o in self.offsets[index:]]
+        self.length -= shift
+
+        if self._blob is not None:
+            if index < len(self.names):
+                self._blob = self._blob[:offset] + self._blob[offset + shift:]
+            else:
+                # 末尾の要素には区切りの改行が後ろに付かない
+                self._blob = self._blob[:max(0, offset - 1)]
+
+        if self._sorted_indices is not None:
+            pos = bisect_left(self._sorted_names, name)
+            while self._sorted_indices[pos] != index:
+                pos += 1
+            del self._sorted_indices[pos]
+            del self._sorted_names[pos]
+            self._sorted_indices = [i - 1 if i > index else i for i in self._sorted_indices]
+
+    def build(self):
+        if self._blob is None:
+            self._blob = "\n".join(self.names)
+        if self._sorted_indices is None:
+            self._sorted_indices = sorted(range(len(self.names)), key=self.names.__getitem__)
+            self._sorted_names = [self.names[i] for i in self._sorted_indices]
+
+    def search(self, query, limit=100):
+        """前方一致を優先し、続けて部分一致したインデックスを返す"""
+        query = query.strip().lower()
+        if not query or "\n" in query:
+            return []
+        self.build()
+
+        # 前方一致: ソート済みファイル名を二分探索
+        prefix_matches = []
+        pos = bisect_left(self._sorted_names, query)
+        while pos < len(self._sorted_names) and len(prefix_matches) < limit:
+            if not self._sorted_names[pos].startswith(query):
+                break
+            prefix_matches.append(self._sorted_indices[pos])
+            pos += 1
+        prefix_matches.sort()
+        results = prefix_matches
+        seen = set(prefix_matches)
+
+        # 部分一致: 連結文字列を str.find で走査
+        pos = self._blob.find(query)
+        while pos != -1 and len(results) < limit:
+            i = bisect_right(self.offsets, pos) - 1
+            if i not in seen:
+                results.append(i)
+                seen.add(i)
+            pos = self._blob.find(query, self.offsets[i] + len(self.names[i]) + 1)
+        return results
+
+
 class ImageViewer(QWidget):
     def __init__(self):
         super().__init__()
@@ -54,6 +143,7 @@ class ImageViewer(QWidget):
         self.is_original_size = False
         self.current_root_path = None  # ユーザーが選択した親フォルダ
         self.current_depth = 0  # 選択された階層数 (0=なし, 1-3=階層, -1=全階層)
+        self.search_index = FilenameSearchIndex()
 
         if os.path.exists(self.config_path):
             with open(self.config_path, "r") as f:
@@ -111,6 +201,18 @@ class ImageViewer(QWidget):
         self.progress_bar.mouseReleaseEvent = self.progress_bar_released
         self.layout.addWidget(self.progress_bar)
 
+        # ファイル名検索 (Ctrl+F で表示)
+        self.search_box = QLineEdit(self)
+        self.search_box.setPlaceholderText("ファイル名で検索 (Enter: 移動, Esc: 閉じる)")
+        self.search_box.textChanged.connect(self.update_search_results)
+        self.search_box.installEventFilter(self)
+        self.search_box.hide()
+
+        self.search_results = QListWidget(self)
+        self.search_results.setMaximumHeight(200)
+        self.search_results.itemActivated.connect(self.jump_to_search_result)
+        self.search_results.hide()
+
         self.label = ResizableLabel()
         self.layout.addWidget(self.label)
 
@@ -252,7 +354,9 @@ class ImageViewer(QWidget):
             self.display_pixmap()
 
     def keyPressEvent(self, event):
-        if event.key() == Qt.Key_F:
+        if event.key() == Qt.Key_F and event.modifiers() == Qt.ControlModifier:
+            self.open_search()
+        elif event.key() == Qt.Key_F:
             self.showFullScreen()
         elif event.key() == Qt.Key_Escape and self.isFullScreen():
             self.showNormal()
@@ -261,6 +365,78 @@ class ImageViewer(QWidget):
         elif event.key() == Qt.Key_Right:
             self.move_index(1)
 
+    def open_search(self):
+        if not self.images:
+            return
+        self.search_index.build()
+        self.position_search_ui()
+        self.search_box.show()
+        self.search_box.raise_()
+        self.search_box.setFocus()
+        self.search_box.selectAll()
+        self.update_search_results(self.search_box.text())
+
+    def position_search_ui(self):
+        # レイアウトに入れず画像の上に重ねて表示する (画像の表示領域を変えないため)
+        top = self.progress_bar.height()
+        self.search_box.setGeometry(0, top, self.width(), self.search_box.sizeHint().height())
+        self.search_results.setGeometry(0, self.search_box.geometry().bottom() + 1, self.width(), 200)
+
+    def close_search(self):
+        self.search_box.hide()
+        self.search_results.hide()
+        self.setFocus()
+
+    def update_search_results(self, text):
+        # 候補はファイル名のみ表示し、画像のデコードは選択されるまで行わない
+        self.search_results.clear()
+        matches = self.search_index.search(text)
+        for i in matches:
+            image_path = self.images[i]
+            folder_name = os.path.basename(os.path.dirname(image_path))
+            item = QListWidgetItem(f"{os.path.basename(image_path)}  ({folder_name})")
+            item.setData(Qt.UserRole, i)
+            self.search_results.addItem(item)
+        if matches:
+            self.search_results.setCurrentRow(0)
+            self.search_results.show()
+            self.search_results.raise_()
+        else:
+            self.search_results.hide()
+
+    def jump_to_search_result(self, item=None):
+        if self.is_loading:
+            return
+        if item is None:
+            item = self.search_results.currentItem()
+        if item is None:
+            return
+        index = item.data(Qt.UserRole)
+        if not 0 <= index < len(self.images):
+            return
+        self.index = index
+        self.zoom_factor = 1.0
+        self.pan_offset = QPoint(0, 0)
+        self.is_original_size = False
+        self.close_search()
+        self.update_image()
+
+    def eventFilter(self, obj, event):
+        if obj is self.search_box and event.type() == QEvent.KeyPress:
+            key = event.key()
+            if key == Qt.Key_Escape:
+                self.close_search()
+                return True
+            elif key in (Qt.Key_Return, Qt.Key_Enter):
+                self.jump_to_search_result()
+                return True
+            elif key in (Qt.Key_Up, Qt.Key_Down) and self.search_results.count():
+                step = -1 if key == Qt.Key_Up else 1
+                row = self.search_results.currentRow() + step
+                self.search_results.setCurrentRow(max(0, min(row, self.search_results.count() - 1)))
+                return True
+        return super().eventFilter(obj, event)
+
     def move_index(self, delta):
         if not self.images or self.is_loading:
             return
@@ -344,7 +520,10 @@ class ImageViewer(QWidget):
             if checkbox.isChecked():
                 self.suppress_missing_file_warning = True
 
+        self.search_index.remove(self.images.index(image_path))
         self.images.remove(image_path)
+        if self.search_box.isVisible():
+            self.update_search_results(self.search_box.text())
 
         if not self.images:
             self.label.clear()
@@ -410,6 +589,7 @@ class ImageViewer(QWidget):
             self.label.setPixmap(result)
 
     def resizeEvent(self, event):
+        self.position_search_ui()
         if self.images:
             self.display_pixmap()
         super().resizeEvent(event)
@@ -435,6 +615,8 @@ class ImageViewer(QWidget):
         if self.images:
             self.update_history()
         self.images = []
+        self.search_index.clear()
+        self.close_search()
 
         # ルートディレクトリを記録
         self.current_root_path = os.path.normpath(dir_path)
@@ -447,6 +629,7 @@ class ImageViewer(QWidget):
         for file in files:
             if file.lower().endswith(tuple(self.supported_extensions)):
                 self.images.append(os.path.normpath(os.path.join(dir_path, file)))
+                self.search_index.add(file)
 
         subfolders = [f.path for f in os.scandir(dir_path) if f.is_dir()]
         if subfolders:
@@ -504,6 +687,7 @@ class ImageViewer(QWidget):
                         for subfile in subfiles:
                             if subfile.lower().endswith(tuple(self.supported_extensions)):
                                 self.images.append(os.path.normpath(os.path.join(subfolder, subfile)))
+                                self.search_index.add(subfile)
                     except PermissionError:
                         pass
 
@@ -615,6 +799,8 @@ class ImageViewer(QWidget):
                 # current_root_path を使用して比較
                 if self.images and dir_path == self.current_root_path:
                     self.images = []
+                    self.search_index.clear()
+                    self.close_search()
                     self.label.clear()
                     self.current_root_path = None
                     self.current_depth = 0